@@ -93,6 +93,11 @@ def parse_args_neuron(parser: "ArgumentParser"):
         action="store_true",
         help="Whether to disable the validation of the exported model on neuron device compared to the outputs of original PyTorch model on CPU.",
     )
+    optional_group.add_argument(
+        "--fast-validate",
+        action="store_true",
+        help="Whether to only compare the output shapes and a small leading slice of each output tensor during validation, instead of the full numerical comparison. Much cheaper for large models, at the cost of validation coverage.",
+    )
     optional_group.add_argument(
         "--auto_cast",
         type=str,
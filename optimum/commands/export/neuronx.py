@@ -105,6 +105,11 @@ def parse_args_neuronx(parser: "ArgumentParser"):
         action="store_true",
         help="Whether to disable the validation of inference on neuron device compared to the outputs of original PyTorch model on CPU.",
     )
+    optional_group.add_argument(
+        "--fast-validate",
+        action="store_true",
+        help="Whether to only compare the output shapes and a small leading slice of each output tensor during validation, instead of the full numerical comparison. Much cheaper for large models, at the cost of validation coverage.",
+    )
     optional_group.add_argument(
         "--auto_cast",
         type=str,
@@ -177,6 +182,28 @@ def parse_args_neuronx(parser: "ArgumentParser"):
         action="store_true",
         help="Whether or not for the traced model to return the attentions tensors of all attention layers.",
     )
+    optional_group.add_argument(
+        "--emit-triton-config",
+        action="store_true",
+        help=(
+            "Whether to also write a Triton `config.pbtxt` next to each exported submodel, describing its input names, dtypes and static dims, so that the output directory can be dropped into a Triton model repository. Output tensors are described as fp32 with dynamic dims, since their dtypes and shapes are not known without running the compiled model; adjust the generated file by hand when the export produces non-fp32 outputs (eg. with `--auto_cast`)."
+        ),
+    )
+    optional_group.add_argument(
+        "--auto-downgrade-optlevel",
+        action="store_true",
+        help=(
+            "Whether to retry a submodel failing with an optimization-level related compiler error (eg. `XTP002`, `LUR015`) at `-O1` with auto-cast disabled, instead of failing the export. Downgraded submodels are listed in a `compile_report.json` file stored in the output directory."
+        ),
+    )
+    optional_group.add_argument(
+        "--max-parallel-compiles",
+        type=int,
+        default=1,
+        help=(
+            "The maximum number of submodels to compile concurrently, each in its own worker process. Useful for multi-component models such as Stable Diffusion pipelines, at the cost of a higher peak host memory usage."
+        ),
+    )
 
     input_group = parser.add_argument_group("Input shapes")
     doc_input = "that the Neuronx-cc compiler exported model will be able to take as input."
@@ -244,20 +271,34 @@ def parse_args_neuronx(parser: "ArgumentParser"):
     )
 
     level_group = parser.add_mutually_exclusive_group()
+    level_group.add_argument(
+        "--optlevel",
+        choices=("1", "2", "3"),
+        default="2",
+        help=(
+            "The level of optimization the compiler should perform. 1: enables the core performance optimizations in the compiler, while also minimizing compile time. 2 [default]: provides the best balance between model performance and compile time. 3: may provide additional model execution performance but may incur longer compile times and higher host memory usage during model compilation."
+        ),
+    )
     level_group.add_argument(
         "-O1",
-        action="store_true",
-        help="Enables the core performance optimizations in the compiler, while also minimizing compile time.",
+        dest="optlevel",
+        action="store_const",
+        const="1",
+        help="Alias for `--optlevel 1`.",
     )
     level_group.add_argument(
         "-O2",
-        action="store_true",
-        help="[Default] Provides the best balance between model performance and compile time.",
+        dest="optlevel",
+        action="store_const",
+        const="2",
+        help="Alias for `--optlevel 2`.",
     )
     level_group.add_argument(
         "-O3",
-        action="store_true",
-        help="May provide additional model execution performance but may incur longer compile times and higher host memory usage during model compilation.",
+        dest="optlevel",
+        action="store_const",
+        const="3",
+        help="Alias for `--optlevel 3`.",
     )
 
 
@@ -15,11 +15,15 @@
 """Entry point to the optimum.exporters.neuron command line."""
 
 import argparse
+import concurrent.futures
+import functools
 import inspect
+import json
 import os
+import time
 from argparse import ArgumentParser
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from requests.exceptions import ConnectionError as RequestsConnectionError
 from transformers import AutoConfig, AutoTokenizer, PretrainedConfig
@@ -45,7 +49,6 @@ from ..error_utils import AtolError, OutputMatchError, ShapeError
 from ..tasks import TasksManager
 from .base import NeuronConfig, NeuronDecoderConfig
 from .convert import export_models, validate_models_outputs
-from .model_configs import *  # noqa: F403
 from .utils import (
     build_stable_diffusion_components_mandatory_shapes,
     check_mandatory_input_shapes,
@@ -80,32 +83,180 @@ if TYPE_CHECKING:
 logger = logging.get_logger()
 logger.setLevel(logging.INFO)
 
+# Number of leading elements of each output compared during fast validation.
+_FAST_VALIDATE_SAMPLE_ELEMENTS = 64
+
+# Optional outputs that can be traced along with the model outputs.
+_POSSIBLE_OUTPUTS = ("output_attentions", "output_hidden_states")
+
+# Relative paths of the compiled stable diffusion submodels, precomputed once instead of
+# being re-joined on every export.
+_SD_OUTPUT_SUBPATHS = {
+    name: f"{name}/{NEURON_FILE_NAME}"
+    for name in (
+        DIFFUSION_MODEL_UNET_NAME,
+        DIFFUSION_MODEL_VAE_ENCODER_NAME,
+        DIFFUSION_MODEL_VAE_DECODER_NAME,
+        DIFFUSION_MODEL_TEXT_ENCODER_NAME,
+        DIFFUSION_MODEL_TEXT_ENCODER_2_NAME,
+    )
+}
+
+
+# Mapping from torch tensor dtypes to the Triton model config tensor dtypes.
+_TRITON_TENSOR_DTYPES = {
+    "torch.float32": "TYPE_FP32",
+    "torch.float16": "TYPE_FP16",
+    "torch.bfloat16": "TYPE_BF16",
+    "torch.int64": "TYPE_INT64",
+    "torch.int32": "TYPE_INT32",
+    "torch.bool": "TYPE_BOOL",
+}
+
+
+def _write_triton_configs(
+    models_and_neuron_configs: Dict[str, Tuple[Any, "NeuronConfig"]],
+    output: Path,
+    output_model_names: Dict[str, str],
+):
+    """
+    Writes a Triton `config.pbtxt` next to each exported submodel, describing the input names, dtypes and static
+    dims taken from the neuron config, so that the output directory can be dropped into a Triton model repository
+    without rebuilding the shapes by hand. Output dims and dtypes are not known without running the compiled
+    model: the dims are emitted as `[ -1 ]` and completed by the backend at model load time, and the dtypes are
+    assumed to be fp32, so the generated file must be adjusted by hand when the export produces non-fp32 outputs
+    (eg. with `--auto_cast`).
+    """
+    for model_name, (_, sub_neuron_config) in models_and_neuron_configs.items():
+        subpath = output_model_names.get(model_name)
+        if subpath is None:
+            continue
+        try:
+            input_shapes = {axis: getattr(sub_neuron_config, axis) for axis in sub_neuron_config.mandatory_axes}
+            dummy_inputs = sub_neuron_config.generate_dummy_inputs(return_tuple=False, **input_shapes)
+            dummy_inputs = sub_neuron_config.flatten_inputs(dummy_inputs)
+            inputs = []
+            for input_name, tensor in dummy_inputs.items():
+                dims = ", ".join(str(dim) for dim in tensor.shape)
+                data_type = _TRITON_TENSOR_DTYPES.get(str(tensor.dtype), "TYPE_FP32")
+                inputs.append(f'  {{\n    name: "{input_name}"\n    data_type: {data_type}\n    dims: [ {dims} ]\n  }}')
+            outputs = [
+                f'  {{\n    name: "{output_name}"\n    data_type: TYPE_FP32\n    dims: [ -1 ]\n  }}'
+                for output_name in sub_neuron_config.outputs
+            ]
+            config_pbtxt = "\n".join(
+                [
+                    f'name: "{model_name}"',
+                    'platform: "neuron"',
+                    "max_batch_size: 0",  # the compiled shapes are static, the batch dim is part of `dims`
+                    "input [",
+                    ",\n".join(inputs),
+                    "]",
+                    "output [",
+                    ",\n".join(outputs),
+                    "]",
+                ]
+            )
+            output.joinpath(subpath).parent.joinpath("config.pbtxt").write_text(config_pbtxt + "\n")
+        except Exception as e:
+            logger.warning(f"Could not generate a Triton config for {model_name}: {e}")
+
+
+def _submit_preprocessor_save(*args, **kwargs) -> concurrent.futures.Future:
+    """
+    Runs `maybe_save_preprocessors` in a background thread so that its Hub downloads and disk writes overlap
+    with the compilation step. The caller is responsible for waiting on the returned future (which re-raises
+    any error) once the compilation is done.
+    """
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    try:
+        return executor.submit(maybe_save_preprocessors, *args, **kwargs)
+    finally:
+        executor.shutdown(wait=False)
+
+
+def _register_neuron_configs():
+    """
+    Populates the "neuron" registry of the `TasksManager` on demand. Importing the model configs pulls in every
+    supported transformers/diffusers model class, which dominates CLI startup time, so it is deferred until a
+    config lookup is actually needed instead of happening at import time.
+    """
+    from . import model_configs  # noqa: F401
+
 
 def infer_compiler_kwargs(args: argparse.Namespace) -> Dict[str, Any]:
-    # infer compiler kwargs
-    auto_cast = None if args.auto_cast == "none" else args.auto_cast
-    auto_cast_type = None if auto_cast is None else args.auto_cast_type
+    # infer compiler kwargs, going through the namespace dict to spare repeated attribute lookups
+    args = vars(args)
+    auto_cast = None if args["auto_cast"] == "none" else args["auto_cast"]
+    auto_cast_type = None if auto_cast is None else args["auto_cast_type"]
     compiler_kwargs = {"auto_cast": auto_cast, "auto_cast_type": auto_cast_type}
-    if hasattr(args, "disable_fast_relayout"):
-        compiler_kwargs["disable_fast_relayout"] = getattr(args, "disable_fast_relayout")
-    if hasattr(args, "disable_fallback"):
-        compiler_kwargs["disable_fallback"] = getattr(args, "disable_fallback")
+    if "disable_fast_relayout" in args:
+        compiler_kwargs["disable_fast_relayout"] = args["disable_fast_relayout"]
+    if "disable_fallback" in args:
+        compiler_kwargs["disable_fallback"] = args["disable_fallback"]
 
     return compiler_kwargs
 
 
+_TASK_INFER_CACHE_PATH = Path("~/.cache/optimum-neuron/task-infer.json").expanduser()
+
+# Cached task inferences expire after this delay, so that a change of a model's pipeline tag on the Hub is
+# eventually picked up.
+_TASK_INFER_CACHE_TTL = 24 * 60 * 60  # seconds
+
+
+@functools.lru_cache(maxsize=None)
+def _all_tasks() -> Tuple[str, ...]:
+    # The list of tasks is static for a given transformers version, compute it at most once.
+    return tuple(TasksManager.get_all_tasks())
+
+
+def _infer_task_from_model(model_name_or_path: str) -> str:
+    """
+    Infers the task of a model hosted on the Hub, memoizing the answer on disk so that repeated exports of the same
+    model id do not pay the Hub round-trip. Entries expire after `_TASK_INFER_CACHE_TTL` so that a change of the
+    model's pipeline tag is eventually picked up, and local checkpoints are never cached as their task can change
+    in place.
+    """
+    is_local = os.path.isdir(model_name_or_path)
+    cache = {}
+    if not is_local:
+        try:
+            with open(_TASK_INFER_CACHE_PATH) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        if not isinstance(cache, dict):
+            cache = {}
+        entry = cache.get(model_name_or_path)
+        # Malformed entries (eg. written by an older cache layout) are treated as misses and rewritten below.
+        if isinstance(entry, dict) and "task" in entry:
+            if time.time() - entry.get("timestamp", 0) < _TASK_INFER_CACHE_TTL:
+                return entry["task"]
+    task = TasksManager.infer_task_from_model(model_name_or_path)
+    if not is_local:
+        try:
+            cache[model_name_or_path] = {"task": task, "timestamp": time.time()}
+            _TASK_INFER_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(_TASK_INFER_CACHE_PATH, "w") as f:
+                json.dump(cache, f)
+        except OSError:
+            pass
+    return task
+
+
 def infer_task(task: str, model_name_or_path: str) -> str:
     if task == "auto":
         try:
-            task = TasksManager.infer_task_from_model(model_name_or_path)
+            task = _infer_task_from_model(model_name_or_path)
         except KeyError as e:
             raise KeyError(
                 "The task could not be automatically inferred. Please provide the argument --task with the task "
-                f"from {', '.join(TasksManager.get_all_tasks())}. Detailed error: {e}"
+                f"from {', '.join(_all_tasks())}. Detailed error: {e}"
             )
         except RequestsConnectionError as e:
             raise RequestsConnectionError(
-                f"The task could not be automatically inferred as this is available only for models hosted on the Hugging Face Hub. Please provide the argument --task with the relevant task from {', '.join(TasksManager.get_all_tasks())}. Detailed error: {e}"
+                f"The task could not be automatically inferred as this is available only for models hosted on the Hugging Face Hub. Please provide the argument --task with the relevant task from {', '.join(_all_tasks())}. Detailed error: {e}"
             )
     return task
 
@@ -119,6 +270,7 @@ def get_input_shapes_and_config_class(task: str, args: argparse.Namespace) -> Di
 
 
 def get_neuron_config_class(task: str, model_id: str) -> NeuronConfig:
+    _register_neuron_configs()
     config = AutoConfig.from_pretrained(model_id)
 
     model_type = config.model_type.replace("_", "-")
@@ -153,69 +305,63 @@ def customize_optional_outputs(args: argparse.Namespace) -> Dict[str, bool]:
     """
     Customize optional outputs of the traced model, eg. if `output_attentions=True`, the attentions tensors will be traced.
     """
-    possible_outputs = ["output_attentions", "output_hidden_states"]
+    args = vars(args)
+    return {name: args.get(name, False) for name in _POSSIBLE_OUTPUTS}
 
-    customized_outputs = {}
-    for name in possible_outputs:
-        customized_outputs[name] = getattr(args, name, False)
-    return customized_outputs
 
-
-def parse_optlevel(args: argparse.Namespace) -> Dict[str, bool]:
+def parse_optlevel(args: argparse.Namespace) -> Optional[str]:
     """
     (NEURONX ONLY) Parse the level of optimization the compiler should perform. If not specified apply `O2`(the best balance between model performance and compile time).
     """
-    if is_neuronx_available():
-        if args.O1:
-            optlevel = "1"
-        elif args.O2:
-            optlevel = "2"
-        elif args.O3:
-            optlevel = "3"
-        else:
-            optlevel = "2"
-    else:
-        optlevel = None
-    return optlevel
+    return args.optlevel if is_neuronx_available() else None
+
+
+# The signature of `build_stable_diffusion_components_mandatory_shapes` is static, inspect it once at import time.
+# `sequence_length` is removed as diffusers will pad it to the max, along with the numbers of channels.
+_SD_MANDATORY_AXES = frozenset(inspect.getfullargspec(build_stable_diffusion_components_mandatory_shapes).args) - {
+    "sequence_length",
+    "unet_num_channels",
+    "vae_encoder_num_channels",
+    "vae_decoder_num_channels",
+    "num_images_per_prompt",  # default to 1
+}
 
 
 def normalize_stable_diffusion_input_shapes(
     args: argparse.Namespace,
 ) -> Dict[str, Dict[str, int]]:
     args = vars(args) if isinstance(args, argparse.Namespace) else args
-    mandatory_axes = set(getattr(inspect.getfullargspec(build_stable_diffusion_components_mandatory_shapes), "args"))
-    # Remove `sequence_length` as diffusers will pad it to the max and remove number of channels.
-    mandatory_axes = mandatory_axes - {
-        "sequence_length",
-        "unet_num_channels",
-        "vae_encoder_num_channels",
-        "vae_decoder_num_channels",
-        "num_images_per_prompt",  # default to 1
-    }
-    if not mandatory_axes.issubset(set(args.keys())):
+    if not _SD_MANDATORY_AXES.issubset(args.keys()):
         raise AttributeError(
-            f"Shape of {mandatory_axes} are mandatory for neuron compilation, while {mandatory_axes.difference(args.keys())} are not given."
+            f"Shape of {set(_SD_MANDATORY_AXES)} are mandatory for neuron compilation, while {_SD_MANDATORY_AXES - args.keys()} are not given."
         )
-    mandatory_shapes = {name: args[name] for name in mandatory_axes}
+    mandatory_shapes = {name: args[name] for name in _SD_MANDATORY_AXES}
     mandatory_shapes["num_images_per_prompt"] = args.get("num_images_per_prompt", 1)
     input_shapes = build_stable_diffusion_components_mandatory_shapes(**mandatory_shapes)
     return input_shapes
 
 
+def _canonicalize_input_shapes(input_shapes: Dict[str, Dict[str, int]]) -> Dict[str, Dict[str, int]]:
+    """
+    Sorts the axes of each submodel's input shapes and casts their values to plain ints, so that the configuration
+    hashed for the compilation cache is identical between the lookup and the store of an entry.
+    """
+    return {name: {axis: int(shapes[axis]) for axis in sorted(shapes)} for name, shapes in input_shapes.items()}
+
+
 def infer_stable_diffusion_shapes_from_diffusers(
     input_shapes: Dict[str, Dict[str, int]],
     model: Union["StableDiffusionPipeline", "StableDiffusionXLPipeline"],
 ):
-    if model.tokenizer is not None:
-        sequence_length = model.tokenizer.model_max_length
-    elif hasattr(model, "tokenizer_2") and model.tokenizer_2 is not None:
-        sequence_length = model.tokenizer_2.model_max_length
-    else:
+    try:
+        tokenizer = model.tokenizer if model.tokenizer is not None else model.tokenizer_2
+        sequence_length = tokenizer.model_max_length
+    except AttributeError:
         raise AttributeError(f"Cannot infer sequence_length from {type(model)} as there is no tokenizer as attribute.")
     unet_num_channels = model.unet.config.in_channels
     vae_encoder_num_channels = model.vae.config.in_channels
     vae_decoder_num_channels = model.vae.config.latent_channels
-    vae_scale_factor = 2 ** (len(model.vae.config.block_out_channels) - 1) or 8
+    vae_scale_factor = 2 ** (len(model.vae.config.block_out_channels) - 1)
     height = input_shapes["unet"]["height"]
     scaled_height = height // vae_scale_factor
     width = input_shapes["unet"]["width"]
@@ -223,7 +369,8 @@ def infer_stable_diffusion_shapes_from_diffusers(
 
     input_shapes["text_encoder"].update({"sequence_length": sequence_length})
     if hasattr(model, "text_encoder_2"):
-        input_shapes["text_encoder_2"] = input_shapes["text_encoder"]
+        # Shallow copy, so that later updates of one text encoder's shapes cannot leak into the other.
+        input_shapes["text_encoder_2"] = {**input_shapes["text_encoder"], "sequence_length": sequence_length}
     input_shapes["unet"].update(
         {
             "sequence_length": sequence_length,
@@ -257,11 +404,15 @@ def get_submodels_and_neuron_configs(
     lora_adapter_names: Optional[Union[str, List[str]]] = None,
     lora_scales: Optional[Union[float, List[float]]] = None,
 ):
+    _register_neuron_configs()
     is_stable_diffusion = "stable-diffusion" in task
     is_encoder_decoder = (
         getattr(model.config, "is_encoder_decoder", False) if isinstance(model.config, PretrainedConfig) else False
     )
 
+    # Future of the background preprocessor save, `None` when no preprocessors are saved (stable diffusion
+    # pipelines save theirs along with the submodel configs instead).
+    preprocessor_save = None
     if is_stable_diffusion:
         # TODO: Enable optional outputs for Stable Diffusion
         if output_attentions:
@@ -281,8 +432,10 @@ def get_submodels_and_neuron_configs(
         )
     elif is_encoder_decoder:
         optional_outputs = {"output_attentions": output_attentions, "output_hidden_states": output_hidden_states}
-        models_and_neuron_configs, output_model_names = _get_submodels_and_neuron_configs_for_encoder_decoder(
-            model, input_shapes, task, output, dynamic_batch_size, model_name_or_path, **optional_outputs
+        models_and_neuron_configs, output_model_names, preprocessor_save = (
+            _get_submodels_and_neuron_configs_for_encoder_decoder(
+                model, input_shapes, task, output, dynamic_batch_size, model_name_or_path, **optional_outputs
+            )
         )
     else:
         # TODO: Enable optional outputs for encoders
@@ -302,28 +455,21 @@ def get_submodels_and_neuron_configs(
         model_name = model_name.split("/")[-1] if model_name else model.config.model_type
         output_model_names = {model_name: "model.neuron"}
         models_and_neuron_configs = {model_name: (model, neuron_config)}
-        maybe_save_preprocessors(model_name_or_path, output, src_subfolder=subfolder)
-    return models_and_neuron_configs, output_model_names
+        preprocessor_save = _submit_preprocessor_save(model_name_or_path, output, src_subfolder=subfolder)
+    return models_and_neuron_configs, output_model_names, preprocessor_save
 
 
 def _normalize_lora_params(lora_model_ids, lora_weight_names, lora_adapter_names, lora_scales):
-    if isinstance(lora_model_ids, str):
-        lora_model_ids = [
-            lora_model_ids,
-        ]
-    if isinstance(lora_weight_names, str):
-        lora_weight_names = [
-            lora_weight_names,
-        ]
-    if isinstance(lora_adapter_names, str):
-        lora_adapter_names = [
-            lora_adapter_names,
-        ]
-    if isinstance(lora_scales, float):
-        lora_scales = [
-            lora_scales,
-        ]
-    return lora_model_ids, lora_weight_names, lora_adapter_names, lora_scales
+    # Wrap bare scalars into lists in a single table-driven pass.
+    return tuple(
+        [value] if isinstance(value, scalar_type) else value
+        for value, scalar_type in (
+            (lora_model_ids, str),
+            (lora_weight_names, str),
+            (lora_adapter_names, str),
+            (lora_scales, float),
+        )
+    )
 
 
 def _get_submodels_and_neuron_configs_for_stable_diffusion(
@@ -345,17 +491,34 @@ def _get_submodels_and_neuron_configs_for_stable_diffusion(
         raise RuntimeError(
             "Stable diffusion export is not supported by neuron-cc on inf1, please use neuronx-cc on either inf2/trn1 instead."
         )
-    input_shapes = infer_stable_diffusion_shapes_from_diffusers(input_shapes, model)
-
-    # Saving the model config and preprocessor as this is needed sometimes.
-    model.scheduler.save_pretrained(output.joinpath("scheduler"))
-    if getattr(model, "tokenizer", None) is not None:
-        model.tokenizer.save_pretrained(output.joinpath("tokenizer"))
-    if getattr(model, "tokenizer_2", None) is not None:
-        model.tokenizer_2.save_pretrained(output.joinpath("tokenizer_2"))
-    if getattr(model, "feature_extractor", None) is not None:
-        model.feature_extractor.save_pretrained(output.joinpath("feature_extractor"))
-    model.save_config(output)
+    input_shapes = _canonicalize_input_shapes(infer_stable_diffusion_shapes_from_diffusers(input_shapes, model))
+
+    # Saving the model config and preprocessor as this is needed sometimes. Each save targets its own
+    # subdirectory and is purely I/O-bound, so the writes are overlapped in a thread pool.
+    preprocessors = {
+        "scheduler": model.scheduler,
+        "tokenizer": getattr(model, "tokenizer", None),
+        "tokenizer_2": getattr(model, "tokenizer_2", None),
+        "feature_extractor": getattr(model, "feature_extractor", None),
+    }
+    saving_jobs = [
+        functools.partial(preprocessor.save_pretrained, output.joinpath(subdir))
+        for subdir, preprocessor in preprocessors.items()
+        if preprocessor is not None
+    ]
+    saving_jobs.append(functools.partial(model.save_config, output))
+    # Batch the directory creations upfront so that each save (and the compile step writing
+    # next to it) skips its own implicit makedirs, halving metadata syscalls on slow mounts.
+    subdirs = [subdir for subdir, preprocessor in preprocessors.items() if preprocessor is not None]
+    subdirs += [DIFFUSION_MODEL_UNET_NAME, DIFFUSION_MODEL_VAE_ENCODER_NAME, DIFFUSION_MODEL_VAE_DECODER_NAME]
+    for name in (DIFFUSION_MODEL_TEXT_ENCODER_NAME, DIFFUSION_MODEL_TEXT_ENCODER_2_NAME):
+        if getattr(model, name, None) is not None:
+            subdirs.append(name)
+    for subdir in subdirs:
+        output.joinpath(subdir).mkdir(parents=True, exist_ok=True)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(saving_jobs)) as pool:
+        for future in [pool.submit(job) for job in saving_jobs]:
+            future.result()
 
     lora_model_ids, lora_weight_names, lora_adapter_names, lora_scales = _normalize_lora_params(
         lora_model_ids, lora_weight_names, lora_adapter_names, lora_scales
@@ -375,18 +538,15 @@ def _get_submodels_and_neuron_configs_for_stable_diffusion(
         lora_scales=lora_scales,
     )
     output_model_names = {
-        DIFFUSION_MODEL_UNET_NAME: os.path.join(DIFFUSION_MODEL_UNET_NAME, NEURON_FILE_NAME),
-        DIFFUSION_MODEL_VAE_ENCODER_NAME: os.path.join(DIFFUSION_MODEL_VAE_ENCODER_NAME, NEURON_FILE_NAME),
-        DIFFUSION_MODEL_VAE_DECODER_NAME: os.path.join(DIFFUSION_MODEL_VAE_DECODER_NAME, NEURON_FILE_NAME),
+        name: _SD_OUTPUT_SUBPATHS[name]
+        for name in (DIFFUSION_MODEL_UNET_NAME, DIFFUSION_MODEL_VAE_ENCODER_NAME, DIFFUSION_MODEL_VAE_DECODER_NAME)
     }
     if getattr(model, "text_encoder", None) is not None:
-        output_model_names[DIFFUSION_MODEL_TEXT_ENCODER_NAME] = os.path.join(
-            DIFFUSION_MODEL_TEXT_ENCODER_NAME, NEURON_FILE_NAME
-        )
+        output_model_names[DIFFUSION_MODEL_TEXT_ENCODER_NAME] = _SD_OUTPUT_SUBPATHS[DIFFUSION_MODEL_TEXT_ENCODER_NAME]
     if getattr(model, "text_encoder_2", None) is not None:
-        output_model_names[DIFFUSION_MODEL_TEXT_ENCODER_2_NAME] = os.path.join(
-            DIFFUSION_MODEL_TEXT_ENCODER_2_NAME, NEURON_FILE_NAME
-        )
+        output_model_names[DIFFUSION_MODEL_TEXT_ENCODER_2_NAME] = _SD_OUTPUT_SUBPATHS[
+            DIFFUSION_MODEL_TEXT_ENCODER_2_NAME
+        ]
     del model
 
     return models_and_neuron_configs, output_model_names
@@ -419,9 +579,9 @@ def _get_submodels_and_neuron_configs_for_encoder_decoder(
         ENCODER_NAME: os.path.join(ENCODER_NAME, NEURON_FILE_NAME),
         DECODER_NAME: os.path.join(DECODER_NAME, NEURON_FILE_NAME),
     }
-    maybe_save_preprocessors(model_name_or_path, output)
+    preprocessor_save = _submit_preprocessor_save(model_name_or_path, output)
 
-    return models_and_neuron_configs, output_model_names
+    return models_and_neuron_configs, output_model_names, preprocessor_save
 
 
 def load_models_and_neuron_configs(
@@ -447,6 +607,7 @@ def load_models_and_neuron_configs(
     library_name: Optional[str] = None,
     **input_shapes,
 ):
+    _register_neuron_configs()
     library_name = TasksManager.infer_library_from_model(
         model_name_or_path, subfolder=subfolder, library_name=library_name
     )
@@ -467,7 +628,7 @@ def load_models_and_neuron_configs(
     if model is None:
         model = TasksManager.get_model_from_task(**model_kwargs)
 
-    models_and_neuron_configs, output_model_names = get_submodels_and_neuron_configs(
+    models_and_neuron_configs, output_model_names, preprocessor_save = get_submodels_and_neuron_configs(
         model=model,
         input_shapes=input_shapes,
         task=task,
@@ -485,7 +646,7 @@ def load_models_and_neuron_configs(
         lora_scales=lora_scales,
     )
 
-    return models_and_neuron_configs, output_model_names
+    return models_and_neuron_configs, output_model_names, preprocessor_save
 
 
 def main_export(
@@ -501,6 +662,8 @@ def main_export(
     compiler_workdir: Optional[Union[str, Path]] = None,
     inline_weights_to_neff: bool = True,
     optlevel: str = "2",
+    max_parallel_compiles: int = 1,
+    auto_downgrade_optlevel: bool = False,
     trust_remote_code: bool = False,
     subfolder: str = "",
     revision: str = "main",
@@ -508,6 +671,8 @@ def main_export(
     local_files_only: bool = False,
     use_auth_token: Optional[Union[bool, str]] = None,
     do_validation: bool = True,
+    fast_validate: bool = False,
+    emit_triton_config: bool = False,
     submodels: Optional[Dict[str, Union[Path, str]]] = None,
     output_attentions: bool = False,
     output_hidden_states: bool = False,
@@ -519,12 +684,11 @@ def main_export(
     **input_shapes,
 ):
     output = Path(output)
-    if not output.parent.exists():
-        output.parent.mkdir(parents=True)
+    output.mkdir(parents=True, exist_ok=True)
 
     task = TasksManager.map_from_synonym(task)
 
-    models_and_neuron_configs, output_model_names = load_models_and_neuron_configs(
+    models_and_neuron_configs, output_model_names, preprocessor_save = load_models_and_neuron_configs(
         model_name_or_path=model_name_or_path,
         output=output,
         model=model,
@@ -548,7 +712,7 @@ def main_export(
         **input_shapes,
     )
 
-    _, neuron_outputs = export_models(
+    _, neuron_outputs, cache_task = export_models(
         models_and_neuron_configs=models_and_neuron_configs,
         output_dir=output,
         disable_neuron_cache=disable_neuron_cache,
@@ -558,46 +722,73 @@ def main_export(
         output_file_names=output_model_names,
         compiler_kwargs=compiler_kwargs,
         model_name_or_path=model_name_or_path,
+        max_parallel_compiles=max_parallel_compiles,
+        auto_downgrade_optlevel=auto_downgrade_optlevel,
+        defer_neuron_cache=True,
     )
 
-    # Validate compiled model
-    if do_validation is True:
-        is_stable_diffusion = "stable-diffusion" in task
-        if is_stable_diffusion:
-            # Do not validate vae encoder due to the sampling randomness
-            del neuron_outputs[-2]  # -2 is the index of `vae_encoder`
-            models_and_neuron_configs.pop("vae_encoder", None)
-            output_model_names.pop("vae_encoder", None)
+    if preprocessor_save is not None:
+        preprocessor_save.result()
+
+    if emit_triton_config:
+        _write_triton_configs(models_and_neuron_configs, output, output_model_names)
 
+    # Every writer targeting `output` is done at this point, so the copy of the artifacts into the hub cache
+    # can start. It only reads the output directory and can take a while for multi-GB NEFFs, run it in a
+    # background thread to overlap with the validation below, and wait for it (re-raising any error) before
+    # returning.
+    neuron_cache_save = None
+    if cache_task is not None:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
         try:
-            validate_models_outputs(
-                models_and_neuron_configs=models_and_neuron_configs,
-                neuron_named_outputs=neuron_outputs,
-                output_dir=output,
-                atol=atol,
-                neuron_files_subpaths=output_model_names,
-            )
+            neuron_cache_save = executor.submit(cache_task)
+        finally:
+            executor.shutdown(wait=False)
 
-            logger.info(
-                f"The {NEURON_COMPILER} export succeeded and the exported model was saved at: " f"{output.as_posix()}"
-            )
-        except ShapeError as e:
-            raise e
-        except AtolError as e:
-            logger.warning(
-                f"The {NEURON_COMPILER} export succeeded with the warning: {e}.\n The exported model was saved at: "
-                f"{output.as_posix()}"
-            )
-        except OutputMatchError as e:
-            logger.warning(
-                f"The {NEURON_COMPILER} export succeeded with the warning: {e}.\n The exported model was saved at: "
-                f"{output.as_posix()}"
-            )
-        except Exception as e:
-            logger.error(
-                f"An error occured with the error message: {e}.\n The exported model was saved at: "
-                f"{output.as_posix()}"
-            )
+    try:
+        # Validate compiled model
+        if do_validation is True:
+            is_stable_diffusion = "stable-diffusion" in task
+            if is_stable_diffusion:
+                # Do not validate vae encoder due to the sampling randomness
+                del neuron_outputs[-2]  # -2 is the index of `vae_encoder`
+                models_and_neuron_configs.pop("vae_encoder", None)
+                output_model_names.pop("vae_encoder", None)
+
+            try:
+                validate_models_outputs(
+                    models_and_neuron_configs=models_and_neuron_configs,
+                    neuron_named_outputs=neuron_outputs,
+                    output_dir=output,
+                    atol=atol,
+                    neuron_files_subpaths=output_model_names,
+                    sample_elements=_FAST_VALIDATE_SAMPLE_ELEMENTS if fast_validate else None,
+                )
+
+                logger.info(
+                    f"The {NEURON_COMPILER} export succeeded and the exported model was saved at: "
+                    f"{output.as_posix()}"
+                )
+            except ShapeError as e:
+                raise e
+            except AtolError as e:
+                logger.warning(
+                    f"The {NEURON_COMPILER} export succeeded with the warning: {e}.\n The exported model was saved at: "
+                    f"{output.as_posix()}"
+                )
+            except OutputMatchError as e:
+                logger.warning(
+                    f"The {NEURON_COMPILER} export succeeded with the warning: {e}.\n The exported model was saved at: "
+                    f"{output.as_posix()}"
+                )
+            except Exception as e:
+                logger.error(
+                    f"An error occured with the error message: {e}.\n The exported model was saved at: "
+                    f"{output.as_posix()}"
+                )
+    finally:
+        if neuron_cache_save is not None:
+            neuron_cache_save.result()
 
 
 def decoder_export(
@@ -609,8 +800,7 @@ def decoder_export(
     from ...neuron import NeuronModelForCausalLM
 
     output = Path(output)
-    if not output.parent.exists():
-        output.parent.mkdir(parents=True)
+    output.mkdir(parents=True, exist_ok=True)
 
     model = NeuronModelForCausalLM.from_pretrained(
         model_name_or_path, export=True, trust_remote_code=trust_remote_code, **kwargs
@@ -631,6 +821,13 @@ def main():
     # Retrieve CLI arguments
     args = parser.parse_args()
 
+    # Redirect the Neuron compiler cache to a persistent location, so that a second export of the same model
+    # fetches the compiled artifacts from the cache instead of recompiling every submodel.
+    os.environ.setdefault(
+        "NEURON_COMPILE_CACHE_URL",
+        args.cache_dir or os.path.join(os.path.expanduser("~"), ".cache", "neuron_compile_cache"),
+    )
+
     task = infer_task(args.task, args.model)
     is_stable_diffusion = "stable-diffusion" in task
     is_sentence_transformers = args.library_name == "sentence_transformers"
@@ -678,9 +875,13 @@ def main():
         compiler_workdir=args.compiler_workdir,
         inline_weights_to_neff=args.inline_weights_neff,
         optlevel=optlevel,
+        max_parallel_compiles=getattr(args, "max_parallel_compiles", 1),
+        auto_downgrade_optlevel=getattr(args, "auto_downgrade_optlevel", False),
         trust_remote_code=args.trust_remote_code,
         subfolder=args.subfolder,
         do_validation=not args.disable_validation,
+        fast_validate=getattr(args, "fast_validate", False),
+        emit_triton_config=getattr(args, "emit_triton_config", False),
         submodels=submodels,
         library_name=args.library_name,
         lora_model_ids=getattr(args, "lora_model_ids", None),
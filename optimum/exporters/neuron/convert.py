@@ -13,11 +13,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Neuron compiled model check and export functions."""
+import concurrent.futures
 import copy
+import functools
+import json
+import os
+import pickle
 import time
 from collections import OrderedDict
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import torch
@@ -70,6 +75,9 @@ if is_sentence_transformers_available():
 
 logger = logging.get_logger(__name__)  # pylint: disable=invalid-name
 
+# Compiler errors that are known to go away when lowering the optimization level to "1".
+_OPTLEVEL_DOWNGRADE_ERRORS = ("XTP002", "LUR015", "Too many instructions")
+
 
 def validate_models_outputs(
     models_and_neuron_configs: Dict[
@@ -79,6 +87,7 @@ def validate_models_outputs(
     output_dir: Path,
     atol: Optional[float] = None,
     neuron_files_subpaths: Optional[Dict[str, str]] = None,
+    sample_elements: Optional[int] = None,
 ):
     """
     Validates the export of several models, by checking that the outputs from both the reference and the exported model match.
@@ -96,6 +105,10 @@ def validate_models_outputs(
         neuron_files_subpaths (`Optional[List[str]]`, defaults to `None`):
             The relative paths from `output_dir` to the Neuron files to do validation on. The order must be the same as the order of submodels
             in the ordered dict `models_and_neuron_configs`. If None, will use the keys from the `models_and_neuron_configs` as names.
+        sample_elements (`Optional[int]`, defaults to `None`):
+            If set, only the first `sample_elements` elements of each flattened output are compared against the
+            reference values instead of the full tensors, trading validation coverage for a much cheaper check.
+            Output shapes are always fully verified.
 
     Raises:
         ValueError: If the outputs shapes or values do not match between the reference and the exported model.
@@ -129,6 +142,7 @@ def validate_models_outputs(
                 neuron_model_path=neuron_model_path,
                 neuron_named_outputs=neuron_named_outputs[i],
                 atol=atol,
+                sample_elements=sample_elements,
             )
         except Exception as e:
             exceptions.append(f"Validation of {model_name} fails: {e}")
@@ -145,6 +159,7 @@ def validate_model_outputs(
     neuron_model_path: Path,
     neuron_named_outputs: List[str],
     atol: Optional[float] = None,
+    sample_elements: Optional[int] = None,
 ):
     """
     Validates the export by checking that the outputs from both the reference and the exported model match.
@@ -160,6 +175,9 @@ def validate_model_outputs(
             The names of the outputs to check.
         atol (`Optional[float]`, defaults to `None`):
             The absolute tolerance in terms of outputs difference between the reference and the exported model.
+        sample_elements (`Optional[int]`, defaults to `None`):
+            If set, only the first `sample_elements` elements of each flattened output are compared against the
+            reference values instead of the full tensors. Output shapes are always fully verified.
 
     Raises:
         ValueError: If the outputs shapes or values do not match between the reference and the exported model.
@@ -254,6 +272,10 @@ def validate_model_outputs(
             logger.info(f"\t\t-[✓] {output.shape} matches {ref_output.shape}")
 
         # Values
+        if sample_elements is not None:
+            # Only compare a small leading slice, the full comparison is memory-bandwidth bound.
+            ref_output = ref_output.flatten()[:sample_elements]
+            output = output.flatten()[:sample_elements]
         if not np.allclose(ref_output, output, atol=atol):
             max_diff = np.amax(np.abs(ref_output - output))
             logger.error(f"\t\t-[x] values not close enough, max diff: {max_diff} (atol: {atol})")
@@ -286,7 +308,10 @@ def export_models(
     compiler_kwargs: Optional[Dict[str, Any]] = {},
     configs: Optional[Dict[str, Any]] = {},
     model_name_or_path: Optional[str] = None,
-) -> Tuple[List[List[str]], List[List[str]]]:
+    max_parallel_compiles: int = 1,
+    auto_downgrade_optlevel: bool = False,
+    defer_neuron_cache: bool = False,
+) -> Tuple[List[List[str]], List[List[str]], Optional[Callable[[], None]]]:
     """
     Exports a Pytorch model with multiple component models to separate files.
 
@@ -315,9 +340,22 @@ def export_models(
             A list of pretrained model configs.
         model_name_or_path (`Optional[str]`, defaults to `None`):
             Path to pretrained model or model identifier from the Hugging Face Hub.
+        max_parallel_compiles (`int`, defaults to `1`):
+            The number of submodels to compile concurrently. Each compilation runs in its own worker process, so the
+            wall-clock speedup is bounded by the number of host cores and the host memory available.
+        auto_downgrade_optlevel (`bool`, defaults to `False`):
+            Whether to retry a submodel whose compilation failed with a known optimization-level related compiler
+            error (eg. `XTP002`, `LUR015`) at `optlevel="1"` with auto-cast disabled, instead of failing the export.
+            The submodels compiled with the downgraded level are listed in a `compile_report.json` file stored under
+            `output_dir`.
+        defer_neuron_cache (`bool`, defaults to `False`):
+            Whether to return the hub cache upload as a callable instead of running it before returning. Copying the
+            traced artifacts into the cache snapshots the whole `output_dir`, so a caller writing additional files
+            next to the compiled models can schedule the upload once every writer is done.
     Returns:
-        `Tuple[List[List[str]], List[List[str]]]`: A tuple with an ordered list of the model's inputs, and the named
-        outputs from the Neuron configuration.
+        `Tuple[List[List[str]], List[List[str]], Optional[Callable[[], None]]]`: A tuple with an ordered list of the
+        model's inputs, the named outputs from the Neuron configuration, and the deferred hub cache upload when
+        `defer_neuron_cache` is `True` and the export is cached (`None` otherwise).
     """
     outputs = []
     if compiler_workdir is not None:
@@ -328,40 +366,136 @@ def export_models(
             f"Provided {len(output_file_names)} custom names for the export of {len(models_and_neuron_configs)} models. Please provide the same number of names as models to export."
         )
 
-    failed_models = []
-    total_compilation_time = 0
-    compile_configs = {}
-    for i, model_name in enumerate(models_and_neuron_configs.keys()):
-        logger.info(f"***** Compiling {model_name} *****")
-        submodel, sub_neuron_config = models_and_neuron_configs[model_name]
+    # Resolve the target path of each submodel upfront
+    output_paths = {}
+    for model_name in models_and_neuron_configs.keys():
         output_file_name = (
             output_file_names[model_name] if output_file_names is not None else Path(model_name + ".neuron")
         )
-
         output_path = output_dir / output_file_name
         output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_paths[model_name] = output_path
 
-        try:
-            # TODO: Remove after the weights/neff separation compilation of sdxl is patched by a neuron sdk release: https://github.com/aws-neuron/aws-neuron-sdk/issues/859
-            if not inline_weights_to_neff and getattr(sub_neuron_config, "is_sdxl", False):
-                logger.warning(
-                    "The compilation of SDXL's unet with the weights/neff separation is broken since the Neuron sdk 2.18 release. `inline_weights_to_neff` will be set to True and the caching will be disabled. If you still want to separate the neff and weights, please downgrade your Neuron setup to the 2.17.1 release."
-                )
-                inline_weights_to_neff = True
+    # TODO: Remove after the weights/neff separation compilation of sdxl is patched by a neuron sdk release: https://github.com/aws-neuron/aws-neuron-sdk/issues/859
+    if not inline_weights_to_neff and any(
+        getattr(sub_neuron_config, "is_sdxl", False) for _, sub_neuron_config in models_and_neuron_configs.values()
+    ):
+        logger.warning(
+            "The compilation of SDXL's unet with the weights/neff separation is broken since the Neuron sdk 2.18 release. `inline_weights_to_neff` will be set to True and the caching will be disabled. If you still want to separate the neff and weights, please downgrade your Neuron setup to the 2.17.1 release."
+        )
+        inline_weights_to_neff = True
 
-            start_time = time.time()
-            neuron_inputs, neuron_outputs = export(
-                model=submodel,
-                config=sub_neuron_config,
-                output=output_path,
-                compiler_workdir=compiler_workdir,
-                inline_weights_to_neff=inline_weights_to_neff,
-                optlevel=optlevel,
-                **compiler_kwargs,
+    total_compilation_time = 0
+    compilation_results = {}
+    compilation_errors = {}
+    if max_parallel_compiles > 1 and len(models_and_neuron_configs) > 1:
+        # `export` mutates the submodel config (`return_dict`, `torchscript` and the neuron config's
+        # `values_override`) before tracing. In parallel mode those mutations happen in the worker process, so
+        # they are replicated here in the parent for the configs stored next to the compiled artifacts to be
+        # identical to the ones produced by a serial export.
+        for submodel, sub_neuron_config in models_and_neuron_configs.values():
+            if hasattr(submodel, "config"):
+                submodel.config.return_dict = True
+                submodel.config.torchscript = True
+            if sub_neuron_config.values_override is not None:
+                for override_config_key, override_config_value in sub_neuron_config.values_override.items():
+                    setattr(submodel.config, override_config_key, override_config_value)
+        # The submodels are independent, dispatch each compilation to its own worker process.
+        max_workers = min(max_parallel_compiles, len(models_and_neuron_configs), os.cpu_count() or 1)
+        logger.info(f"***** Compiling {len(models_and_neuron_configs)} models with {max_workers} workers *****")
+        start_time = time.time()
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                model_name: pool.submit(
+                    export,
+                    model=submodel,
+                    config=sub_neuron_config,
+                    output=output_paths[model_name],
+                    compiler_workdir=compiler_workdir,
+                    inline_weights_to_neff=inline_weights_to_neff,
+                    optlevel=optlevel,
+                    **compiler_kwargs,
+                )
+                for model_name, (submodel, sub_neuron_config) in models_and_neuron_configs.items()
+            }
+            for model_name, future in futures.items():
+                try:
+                    compilation_results[model_name] = future.result()
+                except (pickle.PicklingError, concurrent.futures.process.BrokenProcessPool) as e:
+                    # Not a compilation failure: the submodel could not even be dispatched to (or returned
+                    # from) its worker process. Fail the export instead of silently dropping the submodel.
+                    raise RuntimeError(
+                        f"Unable to compile {model_name} in a worker process: {e}. Either make the submodel "
+                        "picklable or retry with `max_parallel_compiles=1` to compile in the main process."
+                    ) from e
+                except Exception as e:
+                    compilation_errors[model_name] = e
+        total_compilation_time = time.time() - start_time
+    else:
+        for model_name, (submodel, sub_neuron_config) in models_and_neuron_configs.items():
+            logger.info(f"***** Compiling {model_name} *****")
+            try:
+                start_time = time.time()
+                compilation_results[model_name] = export(
+                    model=submodel,
+                    config=sub_neuron_config,
+                    output=output_paths[model_name],
+                    compiler_workdir=compiler_workdir,
+                    inline_weights_to_neff=inline_weights_to_neff,
+                    optlevel=optlevel,
+                    **compiler_kwargs,
+                )
+                compilation_time = time.time() - start_time
+                total_compilation_time += compilation_time
+                logger.info(f"[Compilation Time] {np.round(compilation_time, 2)} seconds.")
+            except Exception as e:
+                compilation_errors[model_name] = e
+
+    downgraded_models = []
+    if auto_downgrade_optlevel and optlevel != "1":
+        for model_name in list(compilation_errors.keys()):
+            error = compilation_errors[model_name]
+            message = str(error) + str(getattr(error, "stderr", ""))
+            if not any(code in message for code in _OPTLEVEL_DOWNGRADE_ERRORS):
+                continue
+            submodel, sub_neuron_config = models_and_neuron_configs[model_name]
+            logger.warning(
+                f"The compilation of {model_name} failed at optlevel {optlevel} with an error known to be related to "
+                f"the optimization level: {error}.\nRetrying with optlevel 1 and auto-cast disabled."
             )
-            compilation_time = time.time() - start_time
-            total_compilation_time += compilation_time
-            logger.info(f"[Compilation Time] {np.round(compilation_time, 2)} seconds.")
+            try:
+                start_time = time.time()
+                compilation_results[model_name] = export(
+                    model=submodel,
+                    config=sub_neuron_config,
+                    output=output_paths[model_name],
+                    compiler_workdir=compiler_workdir,
+                    inline_weights_to_neff=inline_weights_to_neff,
+                    optlevel="1",
+                    **{**compiler_kwargs, "auto_cast": None},
+                )
+                total_compilation_time += time.time() - start_time
+                compilation_errors.pop(model_name)
+                downgraded_models.append(model_name)
+            except Exception as e:
+                compilation_errors[model_name] = e
+
+    failed_models = []
+    compile_configs = {}
+    for i, model_name in enumerate(models_and_neuron_configs.keys()):
+        submodel, sub_neuron_config = models_and_neuron_configs[model_name]
+        output_path = output_paths[model_name]
+        try:
+            if model_name in compilation_errors:
+                raise compilation_errors[model_name]
+            # Store the arguments actually applied, which differ when the optlevel was downgraded
+            if model_name in downgraded_models:
+                sub_optlevel = "1"
+                sub_compiler_kwargs = {**compiler_kwargs, "auto_cast": None}
+            else:
+                sub_optlevel = optlevel
+                sub_compiler_kwargs = compiler_kwargs
+            neuron_inputs, neuron_outputs = compilation_results[model_name]
             outputs.append((neuron_inputs, neuron_outputs))
             # Add neuron specific configs to model components' original config
             if hasattr(submodel, "config"):
@@ -378,14 +512,14 @@ def export_models(
             model_config = store_compilation_config(
                 config=model_config,
                 input_shapes=sub_neuron_config.input_shapes,
-                compiler_kwargs=compiler_kwargs,
+                compiler_kwargs=sub_compiler_kwargs,
                 input_names=neuron_inputs,
                 output_names=neuron_outputs,
                 dynamic_batch_size=sub_neuron_config.dynamic_batch_size,
                 compiler_type=NEURON_COMPILER_TYPE,
                 compiler_version=NEURON_COMPILER_VERSION,
                 inline_weights_to_neff=inline_weights_to_neff,
-                optlevel=optlevel,
+                optlevel=sub_optlevel,
                 model_type=getattr(sub_neuron_config, "MODEL_TYPE", None),
                 task=getattr(sub_neuron_config, "task", None),
                 output_attentions=getattr(sub_neuron_config, "output_attentions", False),
@@ -403,20 +537,31 @@ def export_models(
 
     logger.info(f"[Total compilation Time] {np.round(total_compilation_time, 2)} seconds.")
 
+    if downgraded_models:
+        compile_report = {"optlevel": optlevel, "downgraded_to_o1": downgraded_models}
+        with open(output_dir / "compile_report.json", "w") as f:
+            json.dump(compile_report, f, indent=2)
+
     # cache neuronx model
+    cache_task = None
     if not disable_neuron_cache and is_neuronx_available():
         model_id = get_model_name_or_path(model_config) if model_name_or_path is None else model_name_or_path
         cache_config = build_cache_config(compile_configs)
         cache_entry = ModelCacheEntry(model_id=model_id, config=cache_config)
-        cache_traced_neuron_artifacts(neuron_dir=output_dir, cache_entry=cache_entry)
+        if defer_neuron_cache:
+            cache_task = functools.partial(
+                cache_traced_neuron_artifacts, neuron_dir=output_dir, cache_entry=cache_entry
+            )
+        else:
+            cache_traced_neuron_artifacts(neuron_dir=output_dir, cache_entry=cache_entry)
 
     # remove models failed to export
     for i, model_name in failed_models:
         output_file_names.pop(model_name)
         models_and_neuron_configs.pop(model_name)
 
-    outputs = list(map(list, zip(*outputs)))
-    return outputs
+    outputs = list(map(list, zip(*outputs))) or [[], []]
+    return outputs[0], outputs[1], cache_task
 
 
 def export(
@@ -15,6 +15,7 @@
 """Utility functions for neuron export."""
 
 import copy
+import functools
 import os
 from collections import OrderedDict
 from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
@@ -304,6 +305,14 @@ def _load_lora_weights_to_pipeline(
     return pipeline
 
 
+def _vae_encoder_forward(vae, sample):
+    return {"latent_sample": vae.encode(x=sample)["latent_dist"].sample()}
+
+
+def _vae_decoder_forward(vae, latent_sample):
+    return vae.decode(z=latent_sample)
+
+
 def get_submodels_for_export_stable_diffusion(
     pipeline: Union["StableDiffusionPipeline", "StableDiffusionXLImg2ImgPipeline"],
     task: str,
@@ -315,6 +324,10 @@ def get_submodels_for_export_stable_diffusion(
 ) -> Dict[str, Union["PreTrainedModel", "ModelMixin"]]:
     """
     Returns the components of a Stable Diffusion model.
+
+    The submodules are handed over by reference instead of being deep-copied, to avoid materializing a second copy
+    of the pipeline weights in host memory. Apart from the vae, which is duplicated once to build separate encoder
+    and decoder wrappers, the returned modules are the ones held by `pipeline`.
     """
     is_sdxl = "xl" in task
 
@@ -336,12 +349,12 @@ def get_submodels_for_export_stable_diffusion(
     if pipeline.text_encoder is not None:
         if is_sdxl or output_hidden_states:
             pipeline.text_encoder.config.output_hidden_states = True
-        models_for_export.append((DIFFUSION_MODEL_TEXT_ENCODER_NAME, copy.deepcopy(pipeline.text_encoder)))
+        models_for_export.append((DIFFUSION_MODEL_TEXT_ENCODER_NAME, pipeline.text_encoder))
 
     text_encoder_2 = getattr(pipeline, "text_encoder_2", None)
     if text_encoder_2 is not None:
         text_encoder_2.config.output_hidden_states = True
-        models_for_export.append((DIFFUSION_MODEL_TEXT_ENCODER_2_NAME, copy.deepcopy(text_encoder_2)))
+        models_for_export.append((DIFFUSION_MODEL_TEXT_ENCODER_2_NAME, text_encoder_2))
 
     # U-NET
     pipeline.unet.set_attn_processor(AttnProcessor())
@@ -367,19 +380,21 @@ def get_submodels_for_export_stable_diffusion(
             "You are not applying optimized attention score computation. If you want better performance, please"
             " set the environment variable with `export NEURON_FUSE_SOFTMAX=1` and recompile the unet model."
         )
-    models_for_export.append((DIFFUSION_MODEL_UNET_NAME, copy.deepcopy(pipeline.unet)))
+    models_for_export.append((DIFFUSION_MODEL_UNET_NAME, pipeline.unet))
 
     if pipeline.vae.config.get("force_upcast", None) is True:
         pipeline.vae.to(dtype=torch.float32)
 
     # VAE Encoder
+    # The `forward` overrides are bound with `functools.partial` on module-level functions instead of closures,
+    # so that the vae submodels stay picklable and can be dispatched to compilation worker processes.
     vae_encoder = copy.deepcopy(pipeline.vae)
-    vae_encoder.forward = lambda sample: {"latent_sample": vae_encoder.encode(x=sample)["latent_dist"].sample()}
+    vae_encoder.forward = functools.partial(_vae_encoder_forward, vae_encoder)
     models_for_export.append((DIFFUSION_MODEL_VAE_ENCODER_NAME, vae_encoder))
 
     # VAE Decoder
-    vae_decoder = copy.deepcopy(pipeline.vae)
-    vae_decoder.forward = lambda latent_sample: vae_decoder.decode(z=latent_sample)
+    vae_decoder = pipeline.vae
+    vae_decoder.forward = functools.partial(_vae_decoder_forward, vae_decoder)
     models_for_export.append((DIFFUSION_MODEL_VAE_DECODER_NAME, vae_decoder))
 
     return OrderedDict(models_for_export)
@@ -400,8 +415,10 @@ def replace_stable_diffusion_submodels(pipeline, submodels):
     if submodels is not None:
         unet_id = submodels.pop("unet", None)
         if unet_id is not None:
-            unet = UNet2DConditionModel.from_pretrained(unet_id)
-            pipeline.unet = unet
+            # Release the original unet before materializing its replacement, to avoid
+            # holding both sets of weights in host memory at the same time.
+            pipeline.unet = None
+            pipeline.unet = UNet2DConditionModel.from_pretrained(unet_id)
 
     return pipeline
 
@@ -728,7 +728,7 @@ class NeuronStableDiffusionPipelineBase(NeuronTracedModel):
             save_dir_path = Path(save_dir.name)
             # 1. Fetch all model configs
             input_shapes_copy = copy.deepcopy(input_shapes)
-            models_and_neuron_configs, _ = load_models_and_neuron_configs(
+            models_and_neuron_configs, _, _ = load_models_and_neuron_configs(
                 model_name_or_path=model_id,
                 output=save_dir_path,
                 model=pipe,
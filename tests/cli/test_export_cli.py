@@ -16,7 +16,9 @@ import os
 import subprocess
 import tempfile
 import unittest
+from argparse import ArgumentParser
 
+from optimum.commands.export.neuronx import parse_args_neuronx
 from optimum.exporters.neuron.model_configs import *  # noqa: F403
 from optimum.neuron.utils import is_neuronx_available
 from optimum.neuron.utils.testing_utils import is_inferentia_test, requires_neuronx
@@ -87,7 +89,7 @@ class TestExportCLI(unittest.TestCase):
     @requires_neuronx
     def test_opt_level(self):
         model_id = "hf-internal-testing/tiny-random-BertModel"
-        optlevels = ["-O1", "-O2", "-O3"]
+        optlevels = [["-O1"], ["-O2"], ["-O3"], ["--optlevel", "1"], ["--optlevel", "2"], ["--optlevel", "3"]]
         for optlevel in optlevels:
             with tempfile.TemporaryDirectory() as tempdir:
                 subprocess.run(
@@ -103,13 +105,45 @@ class TestExportCLI(unittest.TestCase):
                         "1",
                         "--task",
                         "text-classification",
-                        optlevel,
+                        *optlevel,
                         tempdir,
                     ],
                     shell=False,
                     check=True,
                 )
 
+    def test_opt_level_mutually_exclusive(self):
+        parser = ArgumentParser()
+        parse_args_neuronx(parser)
+        # `--optlevel` and its `-O` aliases share the same destination, combining them must be rejected.
+        with self.assertRaises(SystemExit):
+            parser.parse_args(["--model", "hf-internal-testing/tiny-random-BertModel", "--optlevel", "1", "-O2", "out"])
+
+    @requires_neuronx
+    def test_max_parallel_compiles(self):
+        model_id = "hf-internal-testing/tiny-random-BertModel"
+        with tempfile.TemporaryDirectory() as tempdir:
+            subprocess.run(
+                [
+                    "optimum-cli",
+                    "export",
+                    "neuron",
+                    "--model",
+                    model_id,
+                    "--sequence_length",
+                    "16",
+                    "--batch_size",
+                    "1",
+                    "--task",
+                    "text-classification",
+                    "--max-parallel-compiles",
+                    "2",
+                    tempdir,
+                ],
+                shell=False,
+                check=True,
+            )
+
     def test_store_intemediary(self):
         model_id = "hf-internal-testing/tiny-random-BertModel"
         with tempfile.TemporaryDirectory() as tempdir:
@@ -14,15 +14,19 @@
 # limitations under the License.
 
 import copy
+import json
 import os
 import random
+import time
 import unittest
 from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory
 from typing import Dict, List, Optional
+from unittest.mock import patch
 
+import torch
 from parameterized import parameterized
-from transformers import AutoConfig, AutoModelForSeq2SeqLM, set_seed
+from transformers import AutoConfig, AutoModelForSeq2SeqLM, PretrainedConfig, set_seed
 from transformers.testing_utils import require_vision
 
 from optimum.exporters.neuron import (
@@ -33,7 +37,12 @@ from optimum.exporters.neuron import (
     validate_model_outputs,
     validate_models_outputs,
 )
-from optimum.exporters.neuron.__main__ import get_submodels_and_neuron_configs
+from optimum.exporters.neuron.__main__ import (
+    _TASK_INFER_CACHE_TTL,
+    _infer_task_from_model,
+    _write_triton_configs,
+    get_submodels_and_neuron_configs,
+)
 from optimum.exporters.neuron.model_configs import *  # noqa: F403
 from optimum.exporters.tasks import TasksManager
 from optimum.neuron.utils import is_neuron_available
@@ -222,14 +231,14 @@ class NeuronStableDiffusionExportTestCase(unittest.TestCase):
         )
 
         with TemporaryDirectory() as tmpdirname:
-            models_and_neuron_configs, output_model_names = get_submodels_and_neuron_configs(
+            models_and_neuron_configs, output_model_names, _ = get_submodels_and_neuron_configs(
                 model=model,
                 input_shapes=input_shapes,
                 task="stable-diffusion",
                 output=Path(tmpdirname),
                 model_name_or_path=model_id,
             )
-            _, neuron_outputs = export_models(
+            _, neuron_outputs, _ = export_models(
                 models_and_neuron_configs=models_and_neuron_configs,
                 output_dir=Path(tmpdirname),
                 output_file_names=output_model_names,
@@ -241,6 +250,41 @@ class NeuronStableDiffusionExportTestCase(unittest.TestCase):
                 neuron_files_subpaths=output_model_names,
             )
 
+    @parameterized.expand([STABLE_DIFFUSION_MODELS_TINY["stable-diffusion"]])
+    def test_export_for_stable_diffusion_models_parallel(self, model_id):
+        set_seed(SEED)
+
+        # prepare neuron config / models
+        model = StableDiffusionPipeline.from_pretrained(model_id)
+        input_shapes = build_stable_diffusion_components_mandatory_shapes(
+            **{"batch_size": 1, "height": 64, "width": 64, "num_images_per_prompt": 4}
+        )
+
+        with TemporaryDirectory() as tmpdirname:
+            models_and_neuron_configs, output_model_names, _ = get_submodels_and_neuron_configs(
+                model=model,
+                input_shapes=input_shapes,
+                task="stable-diffusion",
+                output=Path(tmpdirname),
+                model_name_or_path=model_id,
+            )
+            _, neuron_outputs, _ = export_models(
+                models_and_neuron_configs=models_and_neuron_configs,
+                output_dir=Path(tmpdirname),
+                output_file_names=output_model_names,
+                max_parallel_compiles=2,
+            )
+            # Every submodel must have been compiled, a submodel failing to reach its worker process
+            # (eg. because it cannot be pickled) is a hard error, not a skipped model.
+            for neuron_file in output_model_names.values():
+                self.assertTrue((Path(tmpdirname) / neuron_file).is_file())
+            validate_models_outputs(
+                models_and_neuron_configs=models_and_neuron_configs,
+                neuron_named_outputs=neuron_outputs,
+                output_dir=Path(tmpdirname),
+                neuron_files_subpaths=output_model_names,
+            )
+
     @parameterized.expand([STABLE_DIFFUSION_MODELS_TINY["stable-diffusion-xl"]])
     def test_export_for_stable_diffusion_xl_models(self, model_id):
         set_seed(SEED)
@@ -252,14 +296,14 @@ class NeuronStableDiffusionExportTestCase(unittest.TestCase):
         )
 
         with TemporaryDirectory() as tmpdirname:
-            models_and_neuron_configs, output_model_names = get_submodels_and_neuron_configs(
+            models_and_neuron_configs, output_model_names, _ = get_submodels_and_neuron_configs(
                 model=model,
                 input_shapes=input_shapes,
                 task="stable-diffusion-xl",
                 output=Path(tmpdirname),
                 model_name_or_path=model_id,
             )
-            _, neuron_outputs = export_models(
+            _, neuron_outputs, _ = export_models(
                 models_and_neuron_configs=models_and_neuron_configs,
                 output_dir=Path(tmpdirname),
                 output_file_names=output_model_names,
@@ -283,7 +327,7 @@ class NeuronStableDiffusionExportTestCase(unittest.TestCase):
         )
 
         with TemporaryDirectory() as tmpdirname:
-            models_and_neuron_configs, output_model_names = get_submodels_and_neuron_configs(
+            models_and_neuron_configs, output_model_names, _ = get_submodels_and_neuron_configs(
                 model=model,
                 input_shapes=input_shapes,
                 task="stable-diffusion",
@@ -294,16 +338,19 @@ class NeuronStableDiffusionExportTestCase(unittest.TestCase):
                 lora_adapter_names=lora_params[2],
                 lora_scales=0.9,
             )
-            _, neuron_outputs = export_models(
+            _, neuron_outputs, _ = export_models(
                 models_and_neuron_configs=models_and_neuron_configs,
                 output_dir=Path(tmpdirname),
                 output_file_names=output_model_names,
             )
+            # Fast validation: the shapes are still fully checked, only the value comparison is
+            # restricted to the leading elements of each output.
             validate_models_outputs(
                 models_and_neuron_configs=models_and_neuron_configs,
                 neuron_named_outputs=neuron_outputs,
                 output_dir=Path(tmpdirname),
                 neuron_files_subpaths=output_model_names,
+                sample_elements=64,
             )
 
 
@@ -323,7 +370,7 @@ class NeuronEncoderDecoderExportTestCase(unittest.TestCase):
         input_shapes = {"batch_size": 1, "sequence_length": 18, "num_beams": 4}
 
         with TemporaryDirectory() as tmpdirname:
-            models_and_neuron_configs, output_model_names = get_submodels_and_neuron_configs(
+            models_and_neuron_configs, output_model_names, preprocessor_save = get_submodels_and_neuron_configs(
                 model=model,
                 input_shapes=input_shapes,
                 task="text2text-generation",
@@ -332,7 +379,8 @@ class NeuronEncoderDecoderExportTestCase(unittest.TestCase):
                 output_attentions=True,
                 output_hidden_states=True,
             )
-            _, neuron_outputs = export_models(
+            preprocessor_save.result()
+            _, neuron_outputs, _ = export_models(
                 models_and_neuron_configs=models_and_neuron_configs,
                 output_dir=Path(tmpdirname),
                 output_file_names=output_model_names,
@@ -343,3 +391,205 @@ class NeuronEncoderDecoderExportTestCase(unittest.TestCase):
                 output_dir=Path(tmpdirname),
                 neuron_files_subpaths=output_model_names,
             )
+
+
+class ExportModelsAutoDowngradeTestCase(unittest.TestCase):
+    """
+    Unit tests of the `auto_downgrade_optlevel` retry logic of `export_models`, with the compilation itself
+    stubbed out so that they run without a neuron device.
+    """
+
+    class _FakeNeuronConfig:
+        input_shapes = {"batch_size": 1, "sequence_length": 16}
+        dynamic_batch_size = False
+
+    class _FakeModel:
+        def __init__(self):
+            self.config = PretrainedConfig()
+
+    def _export_models(self, fake_export, output_dir):
+        with patch("optimum.exporters.neuron.convert.export", side_effect=fake_export), patch(
+            "optimum.exporters.neuron.convert.NEURON_COMPILER_TYPE", "neuronx-cc", create=True
+        ), patch("optimum.exporters.neuron.convert.NEURON_COMPILER_VERSION", "0.0.0", create=True):
+            return export_models(
+                models_and_neuron_configs={"model": (self._FakeModel(), self._FakeNeuronConfig())},
+                output_dir=output_dir,
+                disable_neuron_cache=True,
+                optlevel="2",
+                output_file_names={"model": "model/model.neuron"},
+                auto_downgrade_optlevel=True,
+            )
+
+    def test_downgrades_known_compiler_errors_to_o1(self):
+        calls = []
+
+        def fake_export(**kwargs):
+            calls.append(kwargs)
+            if len(calls) == 1:
+                raise RuntimeError("Compilation failed with error code XTP002.")
+            return ["input_ids"], ["logits"]
+
+        with TemporaryDirectory() as tmpdirname:
+            output_dir = Path(tmpdirname) / "out"
+            _, neuron_outputs, _ = self._export_models(fake_export, output_dir)
+            self.assertEqual(neuron_outputs, [["logits"]])
+            # The retry runs at optlevel 1 with auto-cast disabled.
+            self.assertEqual(len(calls), 2)
+            self.assertEqual(calls[0]["optlevel"], "2")
+            self.assertEqual(calls[1]["optlevel"], "1")
+            self.assertIsNone(calls[1]["auto_cast"])
+            # The stored config and the compile report record the arguments actually applied.
+            saved_config = json.loads((output_dir / "model" / "config.json").read_text())
+            self.assertEqual(saved_config["neuron"]["optlevel"], "1")
+            self.assertIsNone(saved_config["neuron"]["auto_cast"])
+            report = json.loads((output_dir / "compile_report.json").read_text())
+            self.assertEqual(report, {"optlevel": "2", "downgraded_to_o1": ["model"]})
+
+    def test_does_not_retry_unrelated_errors(self):
+        calls = []
+
+        def fake_export(**kwargs):
+            calls.append(kwargs)
+            raise RuntimeError("Some unrelated compilation failure.")
+
+        with TemporaryDirectory() as tmpdirname:
+            output_dir = Path(tmpdirname) / "out"
+            _, neuron_outputs, _ = self._export_models(fake_export, output_dir)
+            self.assertEqual(neuron_outputs, [])
+            self.assertEqual(len(calls), 1)
+            self.assertFalse((output_dir / "compile_report.json").exists())
+
+
+class InferTaskCacheTestCase(unittest.TestCase):
+    """
+    CPU-level tests of the on-disk memo used by `--task auto` exports to avoid repeated Hub task lookups.
+    """
+
+    def _patch_cache(self, tmpdirname, task="text-classification"):
+        cache_path = Path(tmpdirname) / "task-infer.json"
+        path_patcher = patch("optimum.exporters.neuron.__main__._TASK_INFER_CACHE_PATH", cache_path)
+        infer_patcher = patch(
+            "optimum.exporters.neuron.__main__.TasksManager.infer_task_from_model", return_value=task
+        )
+        return cache_path, path_patcher, infer_patcher
+
+    def test_cache_roundtrip(self):
+        with TemporaryDirectory() as tmpdirname:
+            cache_path, path_patcher, infer_patcher = self._patch_cache(tmpdirname)
+            with path_patcher, infer_patcher as infer_mock:
+                self.assertEqual(_infer_task_from_model("some-org/some-model"), "text-classification")
+                self.assertEqual(infer_mock.call_count, 1)
+                # The second resolution of the same model id is served from disk.
+                self.assertEqual(_infer_task_from_model("some-org/some-model"), "text-classification")
+                self.assertEqual(infer_mock.call_count, 1)
+            entry = json.loads(cache_path.read_text())["some-org/some-model"]
+            self.assertEqual(entry["task"], "text-classification")
+            self.assertLessEqual(entry["timestamp"], time.time())
+
+    def test_expired_entry_is_refreshed(self):
+        with TemporaryDirectory() as tmpdirname:
+            cache_path, path_patcher, infer_patcher = self._patch_cache(tmpdirname, task="image-classification")
+            cache_path.write_text(
+                json.dumps(
+                    {
+                        "some-org/some-model": {
+                            "task": "text-classification",
+                            "timestamp": time.time() - _TASK_INFER_CACHE_TTL - 1,
+                        }
+                    }
+                )
+            )
+            with path_patcher, infer_patcher as infer_mock:
+                self.assertEqual(_infer_task_from_model("some-org/some-model"), "image-classification")
+                self.assertEqual(infer_mock.call_count, 1)
+            entry = json.loads(cache_path.read_text())["some-org/some-model"]
+            self.assertEqual(entry["task"], "image-classification")
+
+    def test_corrupt_cache_file_is_ignored(self):
+        with TemporaryDirectory() as tmpdirname:
+            cache_path, path_patcher, infer_patcher = self._patch_cache(tmpdirname)
+            cache_path.write_text("{not json")
+            with path_patcher, infer_patcher as infer_mock:
+                self.assertEqual(_infer_task_from_model("some-org/some-model"), "text-classification")
+                self.assertEqual(infer_mock.call_count, 1)
+            # The corrupt file is replaced with a valid one.
+            entry = json.loads(cache_path.read_text())["some-org/some-model"]
+            self.assertEqual(entry["task"], "text-classification")
+
+    def test_legacy_entry_is_refreshed(self):
+        with TemporaryDirectory() as tmpdirname:
+            cache_path, path_patcher, infer_patcher = self._patch_cache(tmpdirname)
+            # Old cache layout: the entries were plain strings without a timestamp.
+            cache_path.write_text(json.dumps({"some-org/some-model": "fill-mask"}))
+            with path_patcher, infer_patcher as infer_mock:
+                self.assertEqual(_infer_task_from_model("some-org/some-model"), "text-classification")
+                self.assertEqual(infer_mock.call_count, 1)
+            entry = json.loads(cache_path.read_text())["some-org/some-model"]
+            self.assertEqual(entry["task"], "text-classification")
+
+    def test_local_checkpoints_are_not_cached(self):
+        with TemporaryDirectory() as tmpdirname:
+            cache_path, path_patcher, infer_patcher = self._patch_cache(tmpdirname)
+            with path_patcher, infer_patcher as infer_mock:
+                self.assertEqual(_infer_task_from_model(tmpdirname), "text-classification")
+                self.assertEqual(infer_mock.call_count, 1)
+            self.assertFalse(cache_path.exists())
+
+
+class TritonConfigGenerationTestCase(unittest.TestCase):
+    """
+    CPU-level tests of the Triton `config.pbtxt` generation performed by `--emit-triton-config` exports.
+    """
+
+    class _FakeNeuronConfig:
+        mandatory_axes = ("batch_size", "sequence_length")
+        batch_size = 1
+        sequence_length = 16
+        outputs = ["logits"]
+
+        def generate_dummy_inputs(self, return_tuple=False, **input_shapes):
+            shape = (input_shapes["batch_size"], input_shapes["sequence_length"])
+            return {
+                "input_ids": torch.zeros(shape, dtype=torch.int64),
+                "attention_mask": torch.zeros(shape, dtype=torch.int64),
+            }
+
+        def flatten_inputs(self, inputs):
+            return inputs
+
+    def test_write_triton_configs(self):
+        with TemporaryDirectory() as tmpdirname:
+            output = Path(tmpdirname)
+            (output / "model").mkdir()
+            _write_triton_configs(
+                {"model": (None, self._FakeNeuronConfig())}, output, {"model": "model/model.neuron"}
+            )
+            config_pbtxt = (output / "model" / "config.pbtxt").read_text()
+        expected = "\n".join(
+            [
+                'name: "model"',
+                'platform: "neuron"',
+                "max_batch_size: 0",
+                "input [",
+                "  {",
+                '    name: "input_ids"',
+                "    data_type: TYPE_INT64",
+                "    dims: [ 1, 16 ]",
+                "  },",
+                "  {",
+                '    name: "attention_mask"',
+                "    data_type: TYPE_INT64",
+                "    dims: [ 1, 16 ]",
+                "  }",
+                "]",
+                "output [",
+                "  {",
+                '    name: "logits"',
+                "    data_type: TYPE_FP32",
+                "    dims: [ -1 ]",
+                "  }",
+                "]",
+                "",
+            ]
+        )
+        self.assertEqual(config_pbtxt, expected)